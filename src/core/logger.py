@@ -158,6 +158,9 @@ class Logger:
         # Track last log type for spacing between trees
         self._last_was_tree: bool = False
 
+        # Debug logging flag (read once; lets hot paths skip building details)
+        self.debug_enabled: bool = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+
         # Live logs Discord webhook streaming (from env var with bot prefix)
         bot_name = os.getenv("BOT_NAME", "").upper()
         self._live_logs_webhook_url: str = os.getenv(f"{bot_name}_LOGS_WEBHOOK_URL", "")
@@ -603,7 +606,7 @@ class Logger:
 
     def debug(self, message: str, details: Optional[List[Tuple[str, Any]]] = None) -> None:
         """Log a debug message (only if DEBUG env var is set)."""
-        if os.getenv("DEBUG", "").lower() in ("1", "true", "yes"):
+        if self.debug_enabled:
             if details:
                 self.tree(message, details, emoji="🔍")
             else:
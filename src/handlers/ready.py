@@ -8,6 +8,7 @@ Author: حَـــــنَّـــــا
 """
 
 import asyncio
+import time
 import discord
 from discord.ext import tasks
 from datetime import datetime, timezone, timedelta
@@ -146,6 +147,30 @@ _dev_presence_cache = {
     "activities": [],
 }
 
+# Banners are only returned by fetch_user (a REST call), so refresh them rarely
+DEV_BANNER_TTL = 3600
+
+_dev_banner_cache: Optional[str] = None
+_dev_banner_fetched_at: Optional[float] = None
+
+
+async def _get_dev_banner(bot: discord.Client) -> Optional[str]:
+    """Get the developer's banner URL, fetching it at most once per DEV_BANNER_TTL."""
+    global _dev_banner_cache, _dev_banner_fetched_at
+
+    now = time.monotonic()
+    if _dev_banner_fetched_at is not None and now - _dev_banner_fetched_at < DEV_BANNER_TTL:
+        return _dev_banner_cache
+
+    try:
+        dev_user = await bot.fetch_user(config.OWNER_ID)
+        _dev_banner_cache = dev_user.banner.with_size(1024).url if dev_user.banner else None
+        _dev_banner_fetched_at = now
+    except Exception:
+        # Keep the last known banner and try again next cycle
+        pass
+    return _dev_banner_cache
+
 
 def _parse_activities(activities: tuple) -> list:
     """Parse discord activities into serializable format."""
@@ -294,12 +319,7 @@ async def collect_stats(bot: discord.Client) -> None:
                 dev_decoration = dev_member.avatar_decoration.url
 
             # Banner is global only (Discord doesn't support server-specific banners)
-            try:
-                dev_user = await bot.fetch_user(config.OWNER_ID)
-                if dev_user.banner:
-                    dev_banner = dev_user.banner.with_size(1024).url
-            except Exception:
-                pass
+            dev_banner = await _get_dev_banner(bot)
 
             if dev_member.activities:
                 dev_activities = _parse_activities(dev_member.activities)
@@ -9,7 +9,7 @@ Author: حَـــــنَّـــــا
 
 from src.utils.http import http_session
 from src.utils.webhooks import send_webhook
-from src.utils.retry import retry, retry_async
+from src.utils.retry import retry, retry_sync, retry_async
 from src.utils.security import (
     validate_url,
     validate_download_url,
@@ -29,6 +29,7 @@ __all__ = [
     "http_session",
     "send_webhook",
     "retry",
+    "retry_sync",
     "retry_async",
     # Security utilities
     "validate_url",
@@ -42,14 +42,19 @@ _bot_ref: Optional[discord.Client] = None
 _guild_id: Optional[int] = None
 """Guild ID to get icon from."""
 
+_cached_footer_text: str = _get_footer_text()
+"""Cached footer text (env vars don't change at runtime, refreshed on init)."""
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def _get_guild_icon(bot: discord.Client) -> Optional[str]:
+def _resolve_guild_icon(bot: discord.Client) -> Optional[str]:
     """
-    Get server icon URL for embed footers.
+    Resolve server icon URL for embed footers.
+
+    Slow path (may walk bot.guilds) - only used to (re)fill the cache.
 
     Args:
         bot: The bot instance.
@@ -92,16 +97,16 @@ async def init_footer(bot: discord.Client, guild_id: Optional[int] = None) -> No
         bot: The Discord bot client.
         guild_id: Optional guild ID to get icon from (uses first guild if not provided).
     """
-    global _bot_ref, _cached_icon_url, _guild_id
+    global _bot_ref, _cached_icon_url, _guild_id, _cached_footer_text
     _bot_ref = bot
 
     if guild_id:
         _guild_id = guild_id
 
-    footer_text = _get_footer_text()
+    _cached_footer_text = _get_footer_text()
 
     try:
-        _cached_icon_url = _get_guild_icon(bot)
+        _cached_icon_url = _resolve_guild_icon(bot)
 
         # Get guild name for logging
         guild_name = None
@@ -111,7 +116,7 @@ async def init_footer(bot: discord.Client, guild_id: Optional[int] = None) -> No
                 guild_name = guild.name
 
         logger.tree("Footer Initialized", [
-            ("Text", footer_text),
+            ("Text", _cached_footer_text),
             ("Guild", guild_name or "Auto-detected"),
             ("Icon Cached", "Yes" if _cached_icon_url else "No"),
         ], emoji="📝")
@@ -142,7 +147,7 @@ async def refresh_avatar() -> None:
 
     old_url = _cached_icon_url
     try:
-        _cached_icon_url = _get_guild_icon(_bot_ref)
+        _cached_icon_url = _resolve_guild_icon(_bot_ref)
         changed = old_url != _cached_icon_url
         logger.tree("Footer Icon Refreshed", [
             ("Changed", "Yes" if changed else "No"),
@@ -172,24 +177,30 @@ def set_footer(embed: discord.Embed, icon_url: Optional[str] = None) -> discord.
         The embed with footer set.
     """
     url = icon_url if icon_url is not None else _cached_icon_url
-    embed.set_footer(text=_get_footer_text(), icon_url=url)
+    embed.set_footer(text=_cached_footer_text, icon_url=url)
     return embed
 
 
 async def set_footer_async(embed: discord.Embed, bot: Optional[discord.Client] = None) -> discord.Embed:
     """
-    Set the standard footer on an embed, fetching fresh icon.
+    Set the standard footer on an embed.
+
+    Reuses the cached server icon; only resolves it when the cache is
+    still empty. Call refresh_avatar() first to force a fresh lookup.
 
     Args:
         embed: The embed to add footer to.
-        bot: The bot client to fetch icon from.
+        bot: The bot client to resolve icon from if not cached yet.
 
     Returns:
         The embed with footer set.
     """
-    client = bot or _bot_ref
-    icon_url = _get_guild_icon(client) if client else _cached_icon_url
-    return set_footer(embed, icon_url)
+    global _cached_icon_url
+    if _cached_icon_url is None:
+        client = bot or _bot_ref
+        if client:
+            _cached_icon_url = _resolve_guild_icon(client)
+    return set_footer(embed, _cached_icon_url)
 
 
 def set_game_footer(embed: discord.Embed, stats: dict, user: discord.Member) -> discord.Embed:
@@ -216,7 +227,7 @@ def set_game_footer(embed: discord.Embed, stats: dict, user: discord.Member) ->
 # Module Constants
 # =============================================================================
 
-FOOTER_TEXT = _get_footer_text()
+FOOTER_TEXT = _cached_footer_text
 
 
 # =============================================================================
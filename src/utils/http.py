@@ -6,8 +6,9 @@ Shared aiohttp session with connection pooling, retry logic, and rate limiting.
 
 Features:
 - Connection pooling for efficient HTTP requests
+- Async DNS resolution via aiodns (falls back to threaded resolver)
 - Pre-defined timeouts for common use cases
-- Exponential backoff retry on failures and rate limits
+- Decorrelated-jitter backoff retry on failures and rate limits
 - Supports both explicit start/stop and lazy initialization
 
 Usage:
@@ -29,6 +30,10 @@ Usage:
     if resp:
         data = await resp.json()
 
+    # Stream a large body in chunks (resumes on dropped connections):
+    async for chunk in http_session.stream_with_retry("https://...", timeout=DOWNLOAD_TIMEOUT):
+        f.write(chunk)
+
     # In bot shutdown (close):
     await http_session.stop()
 
@@ -37,10 +42,20 @@ Server: discord.gg/syria
 """
 
 import asyncio
+import socket
 import aiohttp
-from typing import Optional, Callable
+from typing import AsyncIterator, Optional
+from yarl import URL
 
+from src.core.exceptions import ExternalAPIError
 from src.core.logger import logger
+from src.utils.retry import decorrelated_jitter
+
+try:
+    import aiodns  # noqa: F401 - only needed by aiohttp.AsyncResolver
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
 
 
 # =============================================================================
@@ -60,6 +75,23 @@ WEBHOOK_TIMEOUT = aiohttp.ClientTimeout(total=10)
 DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=10)
 
 
+# =============================================================================
+# Connection Pool Settings
+# =============================================================================
+
+CONNECTOR_LIMIT = 200  # Max connections
+CONNECTOR_LIMIT_PER_HOST = 32  # Max per host (CDN avatar/icon fetches share one host)
+KEEPALIVE_TIMEOUT = 75  # seconds, matches typical upstream idle close
+DNS_CACHE_TTL = 600  # seconds
+
+# Hosts the bot talks to through this session, warmed up in start()
+PREWARM_HOSTS = (
+    "discord.com",  # Webhooks
+    "cdn.discordapp.com",  # Avatars, icons
+    "api.github.com",  # Commit tracking
+)
+
+
 # =============================================================================
 # Retry Settings
 # =============================================================================
@@ -67,6 +99,20 @@ DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=10)
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0  # seconds
 MAX_BACKOFF_DELAY = 300.0  # 5 minutes max
+RETRY_OVERALL_TIMEOUT = 30.0  # seconds, total budget across all attempts and backoffs
+RETRY_CONCURRENCY_PER_HOST = 4  # Max retry attempts in flight per host (first attempts aren't gated)
+
+# Chunk size for streamed downloads (peak memory per stream)
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_MAX_RESUMES = 2  # Range resumes after a dropped body, on top of the initial request
+
+# Statuses worth retrying (rate limit + transient server errors).
+# Any other status is returned to the caller immediately.
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Methods safe to re-send after a 5xx. Other methods (POST, PATCH) may
+# already have been applied, so they only retry 429 and 503 + Retry-After.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
 
 
 # =============================================================================
@@ -85,6 +131,14 @@ class HTTPSessionManager:
     def __init__(self):
         self._session: Optional[aiohttp.ClientSession] = None
         self._user_agent: str = "DiscordBot/1.0"
+        # Per-host gates so retry storms don't pile onto one host
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        # Per-host rate limit deadlines (loop time) shared by all callers
+        self._rate_limit_until: dict[str, float] = {}
+        # Per-host gate released by a single timer when the rate limit expires
+        self._rate_limit_gates: dict[str, tuple[asyncio.Event, asyncio.TimerHandle]] = {}
+        # Background DNS/TLS warm-up started by start()
+        self._prewarm_task: Optional[asyncio.Task] = None
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -95,7 +149,12 @@ class HTTPSessionManager:
         For production, prefer calling start() during setup_hook.
         """
         if self._session is None or self._session.closed:
-            # Lazy initialization with basic settings
+            return self._ensure_session()
+        return self._session
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Slow path: lazily create a session with basic settings."""
+        if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
                 timeout=DEFAULT_TIMEOUT,
                 headers={"User-Agent": self._user_agent},
@@ -120,12 +179,20 @@ class HTTPSessionManager:
         if user_agent:
             self._user_agent = user_agent
 
+        # Resolve DNS with c-ares when available instead of the getaddrinfo threadpool
+        resolver = aiohttp.AsyncResolver() if HAS_AIODNS else aiohttp.ThreadedResolver()
+
         # Use connector with connection pooling optimizations
         connector = aiohttp.TCPConnector(
-            limit=100,  # Max connections
-            limit_per_host=10,  # Max per host
-            ttl_dns_cache=300,  # Cache DNS for 5 minutes
-            enable_cleanup_closed=True,
+            resolver=resolver,
+            family=socket.AF_INET,
+            use_dns_cache=True,
+            limit=CONNECTOR_LIMIT,
+            limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            force_close=False,
+            enable_cleanup_closed=False,  # Skip periodic walk of closed transports
         )
         self._session = aiohttp.ClientSession(
             connector=connector,
@@ -135,13 +202,44 @@ class HTTPSessionManager:
         logger.tree("HTTP Session Manager", [
             ("Status", "Started"),
             ("Pooling", "Enabled"),
+            ("Resolver", "aiodns" if HAS_AIODNS else "threaded"),
+        ], emoji="🌐")
+
+        # Warm DNS cache and connection pool without delaying startup
+        self._prewarm_task = asyncio.create_task(self._prewarm_hosts())
+
+    async def _prewarm_hosts(self) -> None:
+        """Resolve and open a pooled connection to PREWARM_HOSTS ahead of first use."""
+        session = self._session
+        if session is None:
+            return
+
+        async def warm(host: str) -> None:
+            async with session.head(f"https://{host}/", timeout=FAST_TIMEOUT, allow_redirects=False):
+                pass
+
+        results = await asyncio.gather(*(warm(host) for host in PREWARM_HOSTS), return_exceptions=True)
+        warmed = sum(1 for result in results if not isinstance(result, BaseException))
+        logger.tree("HTTP Hosts Prewarmed", [
+            ("Hosts", f"{warmed}/{len(PREWARM_HOSTS)}"),
         ], emoji="🌐")
 
     async def stop(self) -> None:
         """Stop the HTTP session. Call this in bot close."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        if self._prewarm_task and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+        self._prewarm_task = None
+
+        # Release anyone still waiting out a rate limit
+        for gate, timer in self._rate_limit_gates.values():
+            timer.cancel()
+            gate.set()
+        self._rate_limit_gates.clear()
+        self._rate_limit_until.clear()
+
+        session, self._session = self._session, None
+        if session and not session.closed:
+            await session.close()
             logger.tree("HTTP Session Manager", [
                 ("Status", "Stopped"),
             ], emoji="🔌")
@@ -158,26 +256,28 @@ class HTTPSessionManager:
     # =========================================================================
     # Basic Request Methods
     # =========================================================================
+    # The session is only ever closed through stop(), which also clears
+    # self._session, so these skip the closed check done by the property.
 
     def get(self, url: str, **kwargs):
         """Perform a GET request. Returns a context manager."""
-        return self.session.get(url, **kwargs)
+        return (self._session or self._ensure_session()).get(url, **kwargs)
 
     def post(self, url: str, **kwargs):
         """Perform a POST request. Returns a context manager."""
-        return self.session.post(url, **kwargs)
+        return (self._session or self._ensure_session()).post(url, **kwargs)
 
     def put(self, url: str, **kwargs):
         """Perform a PUT request. Returns a context manager."""
-        return self.session.put(url, **kwargs)
+        return (self._session or self._ensure_session()).put(url, **kwargs)
 
     def delete(self, url: str, **kwargs):
         """Perform a DELETE request. Returns a context manager."""
-        return self.session.delete(url, **kwargs)
+        return (self._session or self._ensure_session()).delete(url, **kwargs)
 
     def patch(self, url: str, **kwargs):
         """Perform a PATCH request. Returns a context manager."""
-        return self.session.patch(url, **kwargs)
+        return (self._session or self._ensure_session()).patch(url, **kwargs)
 
     # =========================================================================
     # Retry Request Methods
@@ -187,45 +287,167 @@ class HTTPSessionManager:
         self,
         url: str,
         max_retries: int = MAX_RETRIES,
+        overall_timeout: float = RETRY_OVERALL_TIMEOUT,
         **kwargs
     ) -> Optional[aiohttp.ClientResponse]:
         """
-        GET request with exponential backoff retry on rate limits and errors.
+        GET request with jittered backoff retry on rate limits and errors.
 
         Args:
             url: URL to fetch
             max_retries: Maximum retry attempts
+            overall_timeout: Total seconds allowed across all attempts
             **kwargs: Additional arguments passed to session.get()
 
         Returns:
             Response object or None if all retries failed
         """
-        return await self._request_with_retry("GET", url, max_retries, **kwargs)
+        return await self._request_with_retry("GET", url, max_retries, overall_timeout, **kwargs)
 
     async def post_with_retry(
         self,
         url: str,
         max_retries: int = MAX_RETRIES,
+        overall_timeout: float = RETRY_OVERALL_TIMEOUT,
         **kwargs
     ) -> Optional[aiohttp.ClientResponse]:
         """
-        POST request with exponential backoff retry on rate limits and errors.
+        POST request with jittered backoff retry on rate limits and errors.
+
+        A 5xx is only retried when it's a 503 with Retry-After; any other 5xx
+        is returned as-is, since the server may already have applied the POST.
 
         Args:
             url: URL to post to
             max_retries: Maximum retry attempts
+            overall_timeout: Total seconds allowed across all attempts
             **kwargs: Additional arguments passed to session.post()
 
         Returns:
             Response object or None if all retries failed
         """
-        return await self._request_with_retry("POST", url, max_retries, **kwargs)
+        return await self._request_with_retry("POST", url, max_retries, overall_timeout, **kwargs)
+
+    async def stream_with_retry(
+        self,
+        url: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        max_retries: int = MAX_RETRIES,
+        max_resumes: int = STREAM_MAX_RESUMES,
+        overall_timeout: float = RETRY_OVERALL_TIMEOUT,
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a GET response body in chunks instead of buffering it.
+
+        Two separate budgets apply:
+        - Connecting: the initial request and each resume go through the
+          normal retry logic, each with up to max_retries attempts within
+          its own overall_timeout (body reads aren't counted against it).
+        - Resuming: if the connection drops mid-body, the download resumes
+          with a Range header from the last byte delivered (the server must
+          answer 206), at most max_resumes times.
+
+        At most max_retries * (1 + max_resumes) requests are sent per stream.
+        Pass timeout=DOWNLOAD_TIMEOUT for large files; the default session
+        timeout also bounds the body read.
+
+        Args:
+            url: URL to fetch
+            chunk_size: Maximum bytes per yielded chunk
+            max_retries: Maximum attempts for each (re)connect
+            max_resumes: Maximum Range resumes after a dropped body
+            overall_timeout: Seconds allowed for each (re)connect, across its attempts
+            **kwargs: Additional arguments passed to session.request()
+
+        Yields:
+            Body chunks as bytes
+
+        Raises:
+            ExternalAPIError: If the request fails or the stream can't be resumed
+        """
+        short_url = url[:60] + "..." if len(url) > 60 else url
+        headers = dict(kwargs.pop("headers", None) or {})
+        received = 0
+
+        for resume in range(max_resumes + 1):
+            if received:
+                headers["Range"] = f"bytes={received}-"
+
+            response = await self._request_with_retry(
+                "GET", url, max_retries, overall_timeout, headers=headers, **kwargs
+            )
+            if response is None:
+                raise ExternalAPIError("Stream request failed", url=short_url)
+
+            async with response:
+                if response.status >= 400:
+                    raise ExternalAPIError("Stream request failed", status_code=response.status, url=short_url)
+                if received and response.status != 206:
+                    # Server ignored Range - resuming would duplicate bytes
+                    raise ExternalAPIError("Stream resume not supported", status_code=response.status, url=short_url)
+
+                try:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        received += len(chunk)
+                        yield chunk
+                    return
+                except (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    logger.tree("HTTP Stream Interrupted", [
+                        ("URL", short_url),
+                        ("Received", f"{received} bytes"),
+                        ("Error", type(e).__name__),
+                        ("Resume", f"{resume + 1}/{max_resumes}" if resume < max_resumes else "None left"),
+                    ], emoji="⚠️")
+
+        raise ExternalAPIError("Stream interrupted", url=short_url, received=received)
+
+    def _get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Get or create the semaphore gating retried requests to a host."""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(RETRY_CONCURRENCY_PER_HOST)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _is_retryable(response: aiohttp.ClientResponse, idempotent: bool) -> bool:
+        """Check if a response status should be retried for this kind of method."""
+        status = response.status
+        if status not in RETRYABLE_STATUSES:
+            return False
+        if idempotent or status == 429:
+            return True
+        # Non-idempotent: only retry when the server says it didn't take the request
+        return status == 503 and "Retry-After" in response.headers
+
+    def _hold_host(self, host: str, delay: float) -> None:
+        """
+        Block new attempts to a host until its rate limit expires.
+
+        All waiters share one Event released by one loop timer, instead of
+        each scheduling its own sleep. Extends an existing hold if needed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+        if deadline <= self._rate_limit_until.get(host, 0.0):
+            return  # Current hold already covers this
+
+        self._rate_limit_until[host] = deadline
+        current = self._rate_limit_gates.get(host)
+        if current is not None and not current[0].is_set():
+            gate, timer = current
+            timer.cancel()
+        else:
+            gate = asyncio.Event()
+        self._rate_limit_gates[host] = (gate, loop.call_at(deadline, gate.set))
 
     async def _request_with_retry(
         self,
         method: str,
         url: str,
         max_retries: int = MAX_RETRIES,
+        overall_timeout: float = RETRY_OVERALL_TIMEOUT,
         **kwargs
     ) -> Optional[aiohttp.ClientResponse]:
         """
@@ -233,22 +455,91 @@ class HTTPSessionManager:
 
         Handles:
         - 429 rate limits with Retry-After header
-        - Connection errors with exponential backoff
+        - Transient 5xx errors (500/502/503/504), honoring Retry-After if present.
+          Only idempotent methods (IDEMPOTENT_METHODS) retry every 5xx; a POST
+          may already have been processed, so it only retries a 503 carrying
+          Retry-After and otherwise gets the 5xx response back.
+        - Connection errors with decorrelated-jitter backoff
         - Timeout errors
+
+        Other statuses (including 4xx) are returned immediately.
+        Retry attempts (not first attempts) per host are capped at
+        RETRY_CONCURRENCY_PER_HOST, so a burst of failures can't all re-hit
+        a struggling host at once.
+        A 429 on a host makes every caller wait out the same Retry-After.
+        Gives up early once overall_timeout would be exceeded, so a single
+        call can't hold a connection slot for max_retries full timeouts.
+
+        Args:
+            method: Uppercase HTTP method (e.g. "GET"), passed straight to session.request()
+            url: URL to request
+            max_retries: Maximum retry attempts
+            overall_timeout: Total seconds allowed across all attempts and backoffs
+            **kwargs: Additional arguments passed to session.request()
+
+        Returns:
+            Response object or None if all retries failed
         """
-        request_method: Callable = getattr(self.session, method.lower())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + overall_timeout
+        reason = "All retries exhausted"
+        backoff_delay = RETRY_BASE_DELAY
+        short_url = url[:60] + "..." if len(url) > 60 else url  # For log output
+        host = URL(url).host or ""
+        idempotent = method in IDEMPOTENT_METHODS
 
         for attempt in range(max_retries):
-            try:
-                response = await request_method(url, **kwargs)
+            # Wait out a rate limit already hit on this host (by anyone)
+            held = self._rate_limit_gates.get(host)
+            if held is not None and not held[0].is_set():
+                if self._rate_limit_until.get(host, 0.0) >= deadline:
+                    reason = "Deadline exceeded (rate limited)"
+                    break
+                await held[0].wait()
+                if self._session is None:
+                    # stop() released the gate - don't lazily reopen a session after shutdown
+                    reason = "Session stopped"
+                    break
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                reason = "Deadline exceeded"
+                break
+
+            # First attempts are bounded by the connector; only retries are gated.
+            # Waiting for a retry slot counts against the overall deadline.
+            semaphore = None
+            if attempt:
+                semaphore = self._get_host_semaphore(host)
+                try:
+                    await asyncio.wait_for(semaphore.acquire(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    reason = "Deadline exceeded"
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0 or self._session is None:
+                    semaphore.release()
+                    reason = "Deadline exceeded" if remaining <= 0 else "Session stopped"
+                    break
 
-                if response.status == 429:
-                    # Consume response body to prevent resource leak
-                    await response.read()
-
-                    # Rate limited - use Retry-After header or exponential backoff
+            try:
+                try:
+                    response = await asyncio.wait_for(
+                        (self._session or self._ensure_session()).request(method, url, **kwargs),
+                        timeout=remaining,
+                    )
+                finally:
+                    if semaphore is not None:
+                        semaphore.release()
+
+                if self._is_retryable(response, idempotent):
+                    # Discarded response - release the connection without buffering the body
+                    response.release()
+
+                    # Use Retry-After header or jittered backoff
                     retry_after = response.headers.get("Retry-After")
-                    delay = RETRY_BASE_DELAY * (2 ** attempt)  # Default fallback
+                    backoff_delay = decorrelated_jitter(RETRY_BASE_DELAY, backoff_delay, MAX_BACKOFF_DELAY)
+                    delay = backoff_delay  # Default fallback
                     if retry_after:
                         try:
                             delay = float(retry_after)
@@ -258,38 +549,54 @@ class HTTPSessionManager:
                     # Cap the delay to prevent excessive waits
                     delay = min(delay, MAX_BACKOFF_DELAY)
 
-                    logger.tree("HTTP Rate Limited", [
-                        ("URL", url[:60] + "..." if len(url) > 60 else url),
-                        ("Attempt", f"{attempt + 1}/{max_retries}"),
-                        ("Retry After", f"{delay:.1f}s"),
-                    ], emoji="⏳")
-
-                    await asyncio.sleep(delay)
+                    # No retry follows the final attempt, so don't announce one
+                    progress = f"attempt {attempt + 1}/{max_retries}"
+                    if attempt < max_retries - 1:
+                        progress += f", retry after {delay:.1f}s"
+
+                    rate_limited = response.status == 429
+                    if rate_limited:
+                        # Broadcast the hold so other callers don't re-hit the limit
+                        self._hold_host(host, delay)
+                        logger.info(f"HTTP Rate Limited: {method} {short_url} ({progress})")
+                    else:
+                        logger.warning(
+                            f"HTTP Server Error {response.status}: {method} {short_url} ({progress})"
+                        )
+
+                    # Rate limits are waited out on the shared gate at the top of the loop;
+                    # no point waiting after the final attempt
+                    if not rate_limited and attempt < max_retries - 1:
+                        if loop.time() + delay >= deadline:
+                            reason = "Deadline exceeded"
+                            break
+                        await asyncio.sleep(delay)
                     continue
 
                 return response
 
             except asyncio.TimeoutError:
-                logger.tree("HTTP Timeout", [
-                    ("URL", url[:60] + "..." if len(url) > 60 else url),
-                    ("Attempt", f"{attempt + 1}/{max_retries}"),
-                ], emoji="⏳")
+                logger.info(
+                    f"HTTP Timeout: {method} {short_url} (attempt {attempt + 1}/{max_retries})"
+                )
             except aiohttp.ClientError as e:
-                logger.tree("HTTP Error", [
-                    ("URL", url[:60] + "..." if len(url) > 60 else url),
-                    ("Error", str(e)[:50]),
-                    ("Attempt", f"{attempt + 1}/{max_retries}"),
-                ], emoji="⚠️")
+                logger.warning(
+                    f"HTTP Error: {method} {short_url} "
+                    f"(attempt {attempt + 1}/{max_retries}): {str(e)[:50]}"
+                )
 
-            # Exponential backoff before retry (capped)
+            # Jittered backoff before retry (capped)
             if attempt < max_retries - 1:
-                delay = min(RETRY_BASE_DELAY * (2 ** attempt), MAX_BACKOFF_DELAY)
-                await asyncio.sleep(delay)
+                backoff_delay = decorrelated_jitter(RETRY_BASE_DELAY, backoff_delay, MAX_BACKOFF_DELAY)
+                if loop.time() + backoff_delay >= deadline:
+                    reason = "Deadline exceeded"
+                    break
+                await asyncio.sleep(backoff_delay)
 
         logger.tree("HTTP Request Failed", [
             ("Method", method),
-            ("URL", url[:60] + "..." if len(url) > 60 else url),
-            ("Reason", "All retries exhausted"),
+            ("URL", short_url),
+            ("Reason", reason),
         ], emoji="❌")
         return None
 
@@ -314,8 +621,21 @@ __all__ = [
     "FAST_TIMEOUT",
     "WEBHOOK_TIMEOUT",
     "DOWNLOAD_TIMEOUT",
+    # Connection pool
+    "CONNECTOR_LIMIT",
+    "CONNECTOR_LIMIT_PER_HOST",
+    "KEEPALIVE_TIMEOUT",
+    "DNS_CACHE_TTL",
+    "PREWARM_HOSTS",
     # Retry settings
     "MAX_RETRIES",
     "RETRY_BASE_DELAY",
     "MAX_BACKOFF_DELAY",
+    "RETRY_OVERALL_TIMEOUT",
+    "RETRY_CONCURRENCY_PER_HOST",
+    # Streaming
+    "STREAM_CHUNK_SIZE",
+    "STREAM_MAX_RESUMES",
+    "RETRYABLE_STATUSES",
+    "IDEMPOTENT_METHODS",
 ]
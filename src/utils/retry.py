@@ -6,8 +6,10 @@ Exponential backoff retry decorators and helpers for handling transient failures
 
 Features:
 - exponential_backoff: Decorator for async functions with configurable retries
-- retry: Decorator that handles both sync and async functions
+- retry: Decorator for async functions
+- retry_sync: Decorator for blocking functions
 - retry_async: Helper for inline retries
+- decorrelated_jitter: Backoff delay calculation shared with the HTTP session
 - CircuitBreaker: Circuit breaker pattern for failing services
 - Safe Discord helpers: safe_fetch_channel, safe_fetch_message, safe_send, etc.
 
@@ -66,6 +68,34 @@ OPENAI_RETRYABLE_EXCEPTIONS: Tuple[Type[Exception], ...] = (
 )
 
 
+# =============================================================================
+# Backoff Helpers
+# =============================================================================
+
+def decorrelated_jitter(
+    base: float,
+    previous: float,
+    cap: float,
+    multiplier: float = 3.0,
+) -> float:
+    """
+    Compute the next retry delay using decorrelated jitter.
+
+    Spreads retries uniformly over [base, previous * multiplier] so concurrent
+    callers don't all wake on the same boundary and re-hit a rate limit.
+
+    Args:
+        base: Minimum delay in seconds
+        previous: Delay used for the previous attempt (use base initially)
+        cap: Maximum delay in seconds
+        multiplier: Upper-bound growth factor (default: 3.0)
+
+    Returns:
+        Next delay in seconds, capped at cap
+    """
+    return min(cap, random.uniform(base, previous * multiplier))
+
+
 # =============================================================================
 # Exponential Backoff Decorator
 # =============================================================================
@@ -94,14 +124,15 @@ def exponential_backoff(
             # ... fetching logic ...
             pass
 
-    Formula: delay = min(base_delay * (2 ** attempt), max_delay)
-    Example with base_delay=10: 10s -> 20s -> 40s (capped at max_delay)
+    Formula: delay = min(max_delay, uniform(base_delay, previous_delay * 3))
+    Example with base_delay=10: each retry waits 10-30s, then 10-60s (capped)
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception: Optional[Exception] = None
+            delay: float = base_delay
 
             for attempt in range(max_retries):
                 try:
@@ -116,9 +147,8 @@ def exponential_backoff(
                         )
                         raise
 
-                    # Calculate exponential backoff delay with jitter
-                    delay: float = min(base_delay * (2 ** attempt), max_delay)
-                    delay += random.uniform(0, delay * 0.1)
+                    # Decorrelated jitter avoids synchronized retry storms
+                    delay = decorrelated_jitter(base_delay, delay, max_delay)
 
                     logger.warning("Retry Attempt Failed", [
                         ("Function", func.__name__),
@@ -141,36 +171,39 @@ def exponential_backoff(
 
 
 # =============================================================================
-# Universal Retry Decorator (Sync + Async)
+# Retry Decorators
 # =============================================================================
 
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    max_delay: float = 30.0,
+    exceptions: Tuple[Type[Exception], ...] = RETRYABLE_EXCEPTIONS,
     on_retry: Optional[Callable[[Exception, int], None]] = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
-    Retry decorator with exponential backoff for both sync and async functions.
+    Retry decorator with exponential backoff for async functions.
+
+    Use retry_sync for blocking functions.
 
     Args:
         max_attempts: Maximum number of retry attempts (default: 3)
         delay: Initial delay between retries in seconds (default: 1.0)
         backoff: Multiplier for delay after each retry (default: 2.0)
-        exceptions: Tuple of exception types to catch and retry (default: Exception)
+        max_delay: Maximum delay cap in seconds (default: 30.0)
+        exceptions: Tuple of exception types to catch and retry (default: RETRYABLE_EXCEPTIONS)
         on_retry: Optional callback called on each retry with (exception, attempt)
 
     Example:
         @retry(max_attempts=3, delay=1.0, exceptions=(aiohttp.ClientError,))
         async def fetch_data():
             ...
-
-        @retry(max_attempts=5, backoff=1.5)
-        def sync_operation():
-            ...
     """
     def decorator(func: Callable) -> Callable:
+        if not asyncio.iscoroutinefunction(func):
+            raise TypeError(f"retry() requires an async function, use retry_sync() for {func.__name__}")
+
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception: Optional[Exception] = None
@@ -189,22 +222,57 @@ def retry(
                         ])
                         raise
 
+                    # Up to 25% jitter, never above the cap
+                    wait = min(current_delay + random.uniform(0, current_delay * 0.25), max_delay)
+
                     logger.info(f"Retry attempt {attempt}/{max_attempts}", [
                         ("Function", func.__name__),
                         ("Error", type(e).__name__),
-                        ("Next delay", f"{current_delay:.1f}s"),
+                        ("Next delay", f"{wait:.1f}s"),
                     ])
 
                     if on_retry:
                         on_retry(e, attempt)
 
-                    await asyncio.sleep(current_delay)
-                    current_delay *= backoff
+                    await asyncio.sleep(wait)
+                    current_delay = min(current_delay * backoff, max_delay)
 
             if last_exception:
                 raise last_exception
             raise RuntimeError(f"{func.__name__} failed without exception")
 
+        return async_wrapper
+
+    return decorator
+
+
+def retry_sync(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    max_delay: float = 30.0,
+    exceptions: Tuple[Type[Exception], ...] = RETRYABLE_EXCEPTIONS,
+    on_retry: Optional[Callable[[Exception, int], None]] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Retry decorator with exponential backoff for blocking functions.
+
+    Sleeps with time.sleep - never use on code running in the event loop.
+
+    Args:
+        max_attempts: Maximum number of retry attempts (default: 3)
+        delay: Initial delay between retries in seconds (default: 1.0)
+        backoff: Multiplier for delay after each retry (default: 2.0)
+        max_delay: Maximum delay cap in seconds (default: 30.0)
+        exceptions: Tuple of exception types to catch and retry (default: RETRYABLE_EXCEPTIONS)
+        on_retry: Optional callback called on each retry with (exception, attempt)
+
+    Example:
+        @retry_sync(max_attempts=5, backoff=1.5)
+        def sync_operation():
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception: Optional[Exception] = None
@@ -223,24 +291,25 @@ def retry(
                         ])
                         raise
 
+                    # Up to 25% jitter, never above the cap
+                    wait = min(current_delay + random.uniform(0, current_delay * 0.25), max_delay)
+
                     logger.info(f"Retry attempt {attempt}/{max_attempts}", [
                         ("Function", func.__name__),
                         ("Error", type(e).__name__),
-                        ("Next delay", f"{current_delay:.1f}s"),
+                        ("Next delay", f"{wait:.1f}s"),
                     ])
 
                     if on_retry:
                         on_retry(e, attempt)
 
-                    time.sleep(current_delay)
-                    current_delay *= backoff
+                    time.sleep(wait)
+                    current_delay = min(current_delay * backoff, max_delay)
 
             if last_exception:
                 raise last_exception
             raise RuntimeError(f"{func.__name__} failed without exception")
 
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator
@@ -261,7 +330,7 @@ async def retry_async(
     **kwargs: Any,
 ) -> Any:
     """
-    Retry an async function with exponential backoff.
+    Retry an async function with exponential backoff and decorrelated jitter.
 
     Args:
         coro_func: Async function to retry
@@ -269,7 +338,7 @@ async def retry_async(
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay in seconds
         max_delay: Maximum delay cap in seconds
-        backoff: Multiplier for delay (default: 2.0)
+        backoff: Upper-bound growth factor for each delay (default: 2.0)
         exceptions: Tuple of exception types to retry on
         **kwargs: Keyword arguments to pass to the function
 
@@ -301,16 +370,15 @@ async def retry_async(
                 ])
                 raise
 
-            delay = min(current_delay, max_delay)
-            delay += random.uniform(0, delay * 0.1)
+            current_delay = decorrelated_jitter(base_delay, current_delay, max_delay, backoff)
 
-            logger.debug("Retry Async", [
-                ("Attempt", f"{attempt + 1}/{max_retries}"),
-                ("Error", str(e)[:50]),
-                ("Delay", f"{delay:.1f}s"),
-            ])
-            await asyncio.sleep(delay)
-            current_delay *= backoff
+            if logger.debug_enabled:
+                logger.debug("Retry Async", [
+                    ("Attempt", f"{attempt + 1}/{max_retries}"),
+                    ("Error", str(e)[:50]),
+                    ("Delay", f"{current_delay:.1f}s"),
+                ])
+            await asyncio.sleep(current_delay)
 
     if last_exception:
         raise last_exception
@@ -334,9 +402,12 @@ class CircuitBreaker:
     After a timeout period, allows a single request through to test recovery.
     """
 
-    CLOSED = "closed"
-    OPEN = "open"
-    HALF_OPEN = "half_open"
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+    # Display names, indexed by state
+    _NAMES = ("closed", "open", "half_open")
 
     def __init__(
         self,
@@ -344,6 +415,8 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 60.0,
         half_open_max_calls: int = 1,
+        backoff_cap: float = 600.0,
+        backoff_factor: float = 2.0,
     ) -> None:
         """
         Initialize circuit breaker.
@@ -353,32 +426,54 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Seconds to wait before testing recovery
             half_open_max_calls: Number of test calls allowed in half-open state
+            backoff_cap: Maximum recovery wait after repeated failed recoveries
+            backoff_factor: Multiplier applied to the wait on each failed recovery
         """
         self.name = name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.half_open_max_calls = half_open_max_calls
+        self.backoff_cap = backoff_cap
+        self.backoff_factor = backoff_factor
 
         self._state = self.CLOSED
         self._failure_count = 0
-        self._last_failure_time: Optional[float] = None
+        self._last_failure_time: Optional[float] = None  # time.monotonic()
+        self._recovery_deadline = 0.0
         self._half_open_calls = 0
+        self._reopen_count = 0
+
+    def _try_transition(self, expected: int, new: int) -> bool:
+        """
+        Move from `expected` to `new` only if the circuit is still in `expected`.
+
+        Runs without awaiting, so on the event loop the check and the write
+        cannot be split by another task - exactly one caller wins.
+        """
+        if self._state != expected:
+            return False
+        self._state = new
+        return True
 
     @property
-    def state(self) -> str:
+    def state(self) -> int:
         """Get current circuit state, checking for recovery timeout."""
-        if self._state == self.OPEN:
-            if self._last_failure_time:
-                elapsed = time.time() - self._last_failure_time
-                if elapsed >= self.recovery_timeout:
-                    self._state = self.HALF_OPEN
-                    self._half_open_calls = 0
-                    logger.info("Circuit Half-Open", [
-                        ("Service", self.name),
-                        ("Testing Recovery", "Yes"),
-                    ])
+        # Only an open circuit needs the clock - closed is the common path
+        if self._state != self.OPEN:
+            return self._state
+        if time.monotonic() >= self._recovery_deadline and self._try_transition(self.OPEN, self.HALF_OPEN):
+            self._half_open_calls = 0
+            logger.info("Circuit Half-Open", [
+                ("Service", self.name),
+                ("Testing Recovery", "Yes"),
+            ])
         return self._state
 
+    @property
+    def state_name(self) -> str:
+        """Get current circuit state as a readable name."""
+        return self._NAMES[self.state]
+
     @property
     def is_open(self) -> bool:
         """Check if circuit is open (blocking requests)."""
@@ -398,12 +493,27 @@ class CircuitBreaker:
             return self._half_open_calls < self.half_open_max_calls
         return False
 
+    def _try_acquire(self) -> bool:
+        """
+        Check and reserve a slot in one step.
+
+        In half-open state the probe slot is claimed here, before any await,
+        so concurrent callers cannot all slip through as probes.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        return False
+
     def record_success(self) -> None:
         """Record a successful call."""
-        if self._state == self.HALF_OPEN:
-            self._state = self.CLOSED
+        if self._try_transition(self.HALF_OPEN, self.CLOSED):
             self._failure_count = 0
             self._last_failure_time = None
+            self._reopen_count = 0
             logger.info("Circuit Closed (Recovered)", [
                 ("Service", self.name),
             ])
@@ -413,16 +523,26 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record a failed call."""
         self._failure_count += 1
-        self._last_failure_time = time.time()
-
-        if self._state == self.HALF_OPEN:
-            self._state = self.OPEN
+        self._last_failure_time = time.monotonic()
+
+        # The recovery deadline is only set when the circuit opens, so late
+        # failures from calls still in flight can't undo the backoff
+        if self._try_transition(self.HALF_OPEN, self.OPEN):
+            # Back off further on each failed recovery, jittered so callers
+            # don't all probe a struggling service at the same moment
+            self._reopen_count += 1
+            timeout = min(
+                self.backoff_cap,
+                self.recovery_timeout * self.backoff_factor ** (self._reopen_count - 1),
+            ) * random.uniform(0.75, 1.25)
+            self._recovery_deadline = self._last_failure_time + timeout
             logger.warning("Circuit Re-Opened (Recovery Failed)", [
                 ("Service", self.name),
-                ("Timeout", f"{self.recovery_timeout}s"),
+                ("Reopens", str(self._reopen_count)),
+                ("Timeout", f"{timeout:.1f}s"),
             ])
-        elif self._state == self.CLOSED and self._failure_count >= self.failure_threshold:
-            self._state = self.OPEN
+        elif self._failure_count >= self.failure_threshold and self._try_transition(self.CLOSED, self.OPEN):
+            self._recovery_deadline = self._last_failure_time + self.recovery_timeout
             logger.warning("Circuit Opened", [
                 ("Service", self.name),
                 ("Failures", str(self._failure_count)),
@@ -452,7 +572,7 @@ class CircuitBreaker:
         Raises:
             CircuitOpenError: If circuit is open and no fallback provided
         """
-        if not self.can_execute():
+        if not self._try_acquire():
             if fallback:
                 logger.debug("Circuit Open - Using Fallback", [
                     ("Service", self.name),
@@ -462,9 +582,6 @@ class CircuitBreaker:
                 return fallback(*args, **kwargs)
             raise CircuitOpenError(f"Circuit breaker '{self.name}' is open")
 
-        if self._state == self.HALF_OPEN:
-            self._half_open_calls += 1
-
         try:
             result = await coro_func(*args, **kwargs)
             self.record_success()
@@ -499,19 +616,51 @@ def get_circuit_breaker(
     Returns:
         CircuitBreaker instance
     """
-    if name not in _circuit_breakers:
-        _circuit_breakers[name] = CircuitBreaker(
-            name=name,
-            failure_threshold=failure_threshold,
-            recovery_timeout=recovery_timeout,
-        )
-    return _circuit_breakers[name]
+    breaker = _circuit_breakers.get(name)
+    if breaker is not None:
+        return breaker
+
+    breaker = CircuitBreaker(
+        name=name,
+        failure_threshold=failure_threshold,
+        recovery_timeout=recovery_timeout,
+    )
+    return _circuit_breakers.setdefault(name, breaker)
 
 
 # =============================================================================
 # Safe Discord Helpers
 # =============================================================================
 
+# Retry delay bounds for the safe_* helpers (two attempts in total)
+SAFE_RETRY_BASE_DELAY = 0.5
+SAFE_RETRY_MAX_DELAY = 30.0
+SAFE_RETRY_BACKOFF = 2.0
+
+
+async def _discord_call(coro_func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Await a Discord API call, retrying once on a transient error.
+
+    The first attempt is awaited directly, so the usual success path never
+    enters the retry loop. Equivalent to retry_async with max_retries=2.
+    """
+    try:
+        return await coro_func(*args, **kwargs)
+    except DISCORD_RETRYABLE_EXCEPTIONS as e:
+        delay = decorrelated_jitter(
+            SAFE_RETRY_BASE_DELAY, SAFE_RETRY_BASE_DELAY, SAFE_RETRY_MAX_DELAY, SAFE_RETRY_BACKOFF,
+        )
+        if logger.debug_enabled:
+            logger.debug("Retry Discord Call", [
+                ("Error", str(e)[:50]),
+                ("Delay", f"{delay:.1f}s"),
+            ])
+
+        await asyncio.sleep(delay)
+        return await coro_func(*args, **kwargs)
+
+
 async def safe_fetch_channel(
     bot: Any,
     channel_id: int,
@@ -536,13 +685,7 @@ async def safe_fetch_channel(
 
     # Fetch with retry
     try:
-        return await retry_async(
-            bot.fetch_channel,
-            channel_id,
-            max_retries=2,
-            base_delay=0.5,
-            exceptions=DISCORD_RETRYABLE_EXCEPTIONS,
-        )
+        return await _discord_call(bot.fetch_channel, channel_id)
     except (discord.NotFound, discord.Forbidden):
         return None
     except Exception as e:
@@ -571,13 +714,7 @@ async def safe_fetch_message(
         return None
 
     try:
-        return await retry_async(
-            channel.fetch_message,
-            message_id,
-            max_retries=2,
-            base_delay=0.5,
-            exceptions=DISCORD_RETRYABLE_EXCEPTIONS,
-        )
+        return await _discord_call(channel.fetch_message, message_id)
     except (discord.NotFound, discord.Forbidden):
         return None
     except Exception as e:
@@ -608,14 +745,7 @@ async def safe_send(
         return None
 
     try:
-        return await retry_async(
-            channel.send,
-            content,
-            max_retries=2,
-            base_delay=0.5,
-            exceptions=DISCORD_RETRYABLE_EXCEPTIONS,
-            **kwargs,
-        )
+        return await _discord_call(channel.send, content, **kwargs)
     except (discord.Forbidden, discord.HTTPException) as e:
         logger.error("Message Send Failed", [
             ("Error", str(e)[:50]),
@@ -641,13 +771,7 @@ async def safe_edit(
         return None
 
     try:
-        return await retry_async(
-            message.edit,
-            max_retries=2,
-            base_delay=0.5,
-            exceptions=DISCORD_RETRYABLE_EXCEPTIONS,
-            **kwargs,
-        )
+        return await _discord_call(message.edit, **kwargs)
     except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
         logger.error("Message Edit Failed", [
             ("Message ID", str(message.id)),
@@ -670,12 +794,7 @@ async def safe_delete(message: discord.Message) -> bool:
         return False
 
     try:
-        await retry_async(
-            message.delete,
-            max_retries=2,
-            base_delay=0.5,
-            exceptions=DISCORD_RETRYABLE_EXCEPTIONS,
-        )
+        await _discord_call(message.delete)
         return True
     except (discord.NotFound, discord.Forbidden, discord.HTTPException):
         return False
@@ -699,18 +818,19 @@ async def safe_add_reaction(
         return False
 
     try:
-        await retry_async(
-            message.add_reaction,
-            emoji,
-            max_retries=2,
-            base_delay=0.5,
-            exceptions=DISCORD_RETRYABLE_EXCEPTIONS,
-        )
+        await _discord_call(message.add_reaction, emoji)
         return True
     except (discord.NotFound, discord.Forbidden, discord.HTTPException):
         return False
 
 
+# Followup error codes that are expected and only logged at debug level
+_FOLLOWUP_KNOWN_CODES: dict[int, str] = {
+    10062: "Unknown Interaction - Token Expired",
+    40060: "Interaction Already Acknowledged",
+}
+
+
 async def safe_followup(
     interaction: discord.Interaction,
     content: Optional[str] = None,
@@ -746,11 +866,10 @@ async def safe_followup(
         logger.debug("Interaction Not Found - Token Expired")
         return None
     except discord.HTTPException as e:
-        # Check for specific error codes
-        if e.code == 10062:  # Unknown interaction
-            logger.debug("Unknown Interaction - Token Expired")
-        elif e.code == 40060:  # Interaction already acknowledged
-            logger.debug("Interaction Already Acknowledged")
+        # Expected error codes are only worth a debug line
+        known = _FOLLOWUP_KNOWN_CODES.get(e.code)
+        if known:
+            logger.debug(known)
         else:
             logger.warning("Followup Send Failed", [
                 ("Error Code", str(e.code)),
@@ -816,8 +935,10 @@ __all__ = [
     # Decorators
     "exponential_backoff",
     "retry",
+    "retry_sync",
     # Helpers
     "retry_async",
+    "decorrelated_jitter",
     # Circuit Breaker
     "CircuitBreaker",
     "CircuitOpenError",
@@ -836,4 +957,7 @@ __all__ = [
     "RETRYABLE_EXCEPTIONS",
     "DISCORD_RETRYABLE_EXCEPTIONS",
     "OPENAI_RETRYABLE_EXCEPTIONS",
+    "SAFE_RETRY_BASE_DELAY",
+    "SAFE_RETRY_MAX_DELAY",
+    "SAFE_RETRY_BACKOFF",
 ]
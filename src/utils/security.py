@@ -10,8 +10,9 @@ Author: حَـــــنَّـــــا
 import re
 import html
 import hashlib
-from typing import Optional, Set
-from urllib.parse import urlparse, parse_qs
+from functools import lru_cache
+from typing import FrozenSet, Optional, Set
+from urllib.parse import urlparse, urlsplit, parse_qs
 
 
 # =============================================================================
@@ -21,24 +22,21 @@ from urllib.parse import urlparse, parse_qs
 # Allowed URL schemes
 ALLOWED_SCHEMES: Set[str] = {"http", "https"}
 
-# Allowed hosts for downloads
-ALLOWED_DOWNLOAD_HOSTS: Set[str] = {
+# Allowed hosts for downloads (frozen so validation results can be cached).
+# A "*.domain" entry allows any subdomain of that domain.
+ALLOWED_DOWNLOAD_HOSTS: FrozenSet[str] = frozenset({
     # Instagram
     "instagram.com",
-    "www.instagram.com",
+    "*.instagram.com",
     # Twitter/X
     "twitter.com",
-    "www.twitter.com",
+    "*.twitter.com",
     "x.com",
-    "www.x.com",
-    "mobile.twitter.com",
-    "mobile.x.com",
+    "*.x.com",
     # TikTok
     "tiktok.com",
-    "www.tiktok.com",
-    "vm.tiktok.com",
-    "vt.tiktok.com",
-}
+    "*.tiktok.com",
+})
 
 # Dangerous URL patterns that could indicate injection
 DANGEROUS_URL_PATTERNS = [
@@ -52,6 +50,12 @@ DANGEROUS_URL_PATTERNS = [
     r"\.\./",  # Path traversal
 ]
 
+# All dangerous patterns folded into one alternation, so a URL is scanned once
+_DANGEROUS_URL_RE = re.compile("|".join(DANGEROUS_URL_PATTERNS), re.IGNORECASE)
+
+# Characters that must never appear in the host part of a URL
+_BAD_AUTHORITY_RE = re.compile(r"[\\\s]")
+
 
 def validate_url(url: str, allowed_hosts: Optional[Set[str]] = None) -> tuple[bool, Optional[str]]:
     """
@@ -67,19 +71,28 @@ def validate_url(url: str, allowed_hosts: Optional[Set[str]] = None) -> tuple[bo
     if not url or not isinstance(url, str):
         return False, "URL is required"
 
+    # Cache key must be hashable
+    if allowed_hosts and not isinstance(allowed_hosts, frozenset):
+        allowed_hosts = frozenset(allowed_hosts)
+
+    return _validate_url_cached(url, allowed_hosts or None)
+
+
+@lru_cache(maxsize=4096)
+def _validate_url_cached(url: str, allowed_hosts: Optional[FrozenSet[str]]) -> tuple[bool, Optional[str]]:
+    """Validate a URL; results are cached since the same links get shared repeatedly."""
     # Check length
     if len(url) > 2048:
         return False, "URL too long"
 
     # Check for dangerous patterns
-    for pattern in DANGEROUS_URL_PATTERNS:
-        if re.search(pattern, url, re.IGNORECASE):
-            return False, "URL contains invalid characters"
+    if _DANGEROUS_URL_RE.search(url):
+        return False, "URL contains invalid characters"
 
-    # Parse URL
+    # Parse URL (urlsplit skips urlparse's unused ;params handling)
     try:
-        parsed = urlparse(url)
-    except Exception:
+        parsed = urlsplit(url)
+    except ValueError:
         return False, "Invalid URL format"
 
     # Check scheme
@@ -90,16 +103,37 @@ def validate_url(url: str, allowed_hosts: Optional[Set[str]] = None) -> tuple[bo
     if not parsed.netloc:
         return False, "URL missing host"
 
-    # Extract hostname (without port)
-    hostname = parsed.netloc.split(":")[0].lower()
+    # Browsers treat "\" as a path separator, so "evil.com\@allowed.com"
+    # would be parsed here as allowed.com but opened as evil.com
+    if _BAD_AUTHORITY_RE.search(parsed.netloc):
+        return False, "URL contains invalid characters"
+
+    # Hostname without credentials or port, lowercased
+    hostname = parsed.hostname
+    if not hostname:
+        return False, "URL missing host"
 
     # Check against allowed hosts if provided
-    if allowed_hosts and hostname not in allowed_hosts:
+    if allowed_hosts and not _host_allowed(hostname, allowed_hosts):
         return False, f"Host not allowed: {hostname}"
 
     return True, None
 
 
+def _host_allowed(hostname: str, allowed_hosts: FrozenSet[str]) -> bool:
+    """Check a hostname against exact entries and "*.domain" wildcard entries."""
+    if hostname in allowed_hosts:
+        return True
+
+    # Walk parent domains one label at a time: a.b.example.com -> b.example.com -> example.com
+    dot = hostname.find(".")
+    while dot != -1:
+        if "*" + hostname[dot:] in allowed_hosts:
+            return True
+        dot = hostname.find(".", dot + 1)
+    return False
+
+
 def validate_download_url(url: str) -> tuple[bool, Optional[str]]:
     """
     Validate a URL specifically for downloads.
@@ -168,6 +202,14 @@ def sanitize_text(text: str, max_length: int = MAX_TEXT_LENGTH) -> str:
     return text
 
 
+# Path separators and other dangerous filename characters become "_";
+# null bytes are removed
+_FILENAME_TRANSLATE = str.maketrans({
+    **{char: "_" for char in '/\\<>:"|?*'},
+    "\x00": None,
+})
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to prevent path traversal and other issues.
@@ -181,14 +223,8 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return "unnamed"
 
-    # Remove path separators
-    filename = filename.replace("/", "_").replace("\\", "_")
-
-    # Remove null bytes
-    filename = filename.replace("\x00", "")
-
-    # Remove other dangerous characters
-    filename = re.sub(r'[<>:"|?*]', "_", filename)
+    # Replace path separators and dangerous characters, drop null bytes
+    filename = filename.translate(_FILENAME_TRANSLATE)
 
     # Remove leading/trailing dots and spaces
     filename = filename.strip(". ")
@@ -200,6 +236,10 @@ def sanitize_filename(filename: str) -> str:
     return filename or "unnamed"
 
 
+# Characters that need escaping in Discord markdown, mapped to escaped form
+_MARKDOWN_ESCAPES = str.maketrans({char: f"\\{char}" for char in "*_`~|>#-=[]()"})
+
+
 def escape_markdown(text: str) -> str:
     """
     Escape Discord markdown characters.
@@ -210,13 +250,7 @@ def escape_markdown(text: str) -> str:
     Returns:
         Escaped text safe for Discord
     """
-    # Characters that need escaping in Discord markdown
-    markdown_chars = ["*", "_", "`", "~", "|", ">", "#", "-", "=", "[", "]", "(", ")"]
-
-    for char in markdown_chars:
-        text = text.replace(char, f"\\{char}")
-
-    return text
+    return text.translate(_MARKDOWN_ESCAPES)
 
 
 def escape_html(text: str) -> str:
@@ -246,6 +280,16 @@ SECRET_PATTERNS = [
     (r"(Bearer\s+)([a-zA-Z0-9_.-]+)", r"\1***REDACTED***"),  # Bearer tokens
 ]
 
+# Precompiled once; applied in order so overlapping secrets are all masked
+_SECRET_PARTS = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in SECRET_PATTERNS
+]
+
+# Literal every secret pattern must contain (lowercase); text without any of
+# them cannot match, so the regexes are skipped
+_SECRET_TRIGGERS = ("token", "api", "password", "secret", "webhook", "bearer")
+
 
 def mask_secrets(text: str) -> str:
     """
@@ -260,9 +304,14 @@ def mask_secrets(text: str) -> str:
     if not text:
         return text
 
+    # Fast path: most log lines contain no trigger word at all
+    lowered = text.lower()
+    if not any(trigger in lowered for trigger in _SECRET_TRIGGERS):
+        return text
+
     result = text
-    for pattern, replacement in SECRET_PATTERNS:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    for regex, replacement in _SECRET_PARTS:
+        result = regex.sub(replacement, result)
 
     return result
 
@@ -279,7 +328,7 @@ def hash_for_logging(value: str) -> str:
     """
     if not value:
         return "<empty>"
-    return hashlib.sha256(value.encode()).hexdigest()[:8]
+    return hashlib.blake2b(value.encode(), digest_size=4).hexdigest()
 
 
 # =============================================================================
@@ -15,6 +15,10 @@ from src.core import log
 from src.utils.http import http_session
 
 
+# Resolved once; embeds are timestamped in UTC
+_UTC = timezone.utc
+
+
 async def send_webhook(
     webhook_url: str,
     title: str,
@@ -47,7 +51,7 @@ async def send_webhook(
             "title": title,
             "color": color,
             "fields": fields,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(_UTC).isoformat(),
             "footer": {"text": footer_text},
         }
 